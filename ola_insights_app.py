@@ -3,10 +3,13 @@
 
 import streamlit as st
 import pandas as pd
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from sqlalchemy import create_engine
 from sqlalchemy.sql import text # Corrected: Import 'text' from sqlalchemy.sql
 import pymysql # Required by SQLAlchemy for MySQL connection, even if not directly used
-import plotly.express as px
+from pymysql.constants import CLIENT
+import plotly.graph_objects as go
 
 # --- Database Connection Configuration ---
 # The app securely fetches credentials from Streamlit secrets.
@@ -25,8 +28,11 @@ import plotly.express as px
 def get_db_engine():
     """
     Creates and returns a SQLAlchemy engine for connecting to the MySQL database.
-    This function now uses Streamlit secrets for credentials and includes
-    more descriptive error messages for connection failures.
+    Connections are established lazily by the pool, so building the engine
+    costs no round-trip; pool_pre_ping validates each connection on checkout
+    and pool_recycle retires ones older than an hour, so stale connections
+    are replaced without an upfront probe query. Connection failures surface
+    at the first real query instead.
     """
     # Create the database URI with a check for the port in secrets
     try:
@@ -38,50 +44,920 @@ def get_db_engine():
         port = st.secrets['mysql'].get('port', 3306)
 
         db_uri = f"mysql+pymysql://{user}:{password}@{host}:{port}/{database}"
-        engine = create_engine(db_uri)
-
-        # Test the connection by executing a simple query
-        with engine.connect() as connection:
-            connection.execute(text("SELECT 1"))
-        st.success("Successfully connected to MySQL database!")
-        return engine
-    except pymysql.err.OperationalError as e:
-        # A more helpful error message for "Can't connect" issues
-        st.error(f"""
-            Error connecting to MySQL database: {e}.
-            This often means the host or port is incorrect, or there's a network issue.
-            Please check:
-            1. Is the database server running and accessible from where this app is running?
-            2. Are your host, user, password, and port in `.streamlit/secrets.toml` correct?
-            3. Are there any firewall rules blocking the connection?
-        """)
-        st.stop()
+        # Pool size leaves headroom for sections that run queries
+        # concurrently, so parallel reads don't serialize on connections.
+        # LIFO checkout reuses the warmest connection on each rerun and
+        # lets the rest of the pool age out via pool_recycle. The
+        # MULTI_STATEMENTS flag lets run_query_batch send several
+        # statements in one round-trip.
+        return create_engine(
+            db_uri,
+            pool_size=8,
+            max_overflow=4,
+            pool_use_lifo=True,
+            pool_pre_ping=True,
+            pool_recycle=3600,
+            connect_args={"client_flag": CLIENT.MULTI_STATEMENTS}
+        )
     except Exception as e:
         st.error(f"An unexpected error occurred during database connection: {e}")
         st.stop()
 
 # --- Function to Run SQL Queries ---
-def run_query(query):
+@st.cache_data(ttl=3600, show_spinner=False)
+def run_query(query, params=None, chunksize=None, parse_dates=None):
     """
     Executes a given SQL query and returns the result as a pandas DataFrame.
+    Filter values are passed as bound parameters (never interpolated into the
+    SQL string), so user input stays safe and MySQL can reuse its prepared
+    statements across reruns. Results are cached by query string and
+    parameters for an hour, so reruns triggered by widget interactions are
+    served from memory instead of re-hitting MySQL.
+
+    For queries that can return many rows, pass chunksize to stream the
+    result from the server in batches and concatenate them; peak memory then
+    stays at roughly one chunk of intermediate copies instead of several
+    copies of the whole result set.
+
+    Results use pyarrow-backed dtypes: strings land in Arrow buffers instead
+    of per-cell Python objects, which shrinks memory and lets Streamlit ship
+    DataFrames to the browser without a pandas-to-Arrow conversion. Date
+    columns named in parse_dates come back typed, so callers don't re-parse
+    them with pd.to_datetime after the fetch.
     """
     engine = get_db_engine()
     try:
-        df = pd.read_sql(query, engine)
+        if chunksize:
+            stream_options = {"stream_results": True, "max_row_buffer": 10_000}
+            with engine.connect().execution_options(**stream_options) as connection:
+                chunks = list(pd.read_sql(
+                    text(query), connection, params=params, chunksize=chunksize,
+                    dtype_backend="pyarrow", parse_dates=parse_dates
+                ))
+            return pd.concat(chunks, copy=False) if chunks else pd.DataFrame()
+        with engine.connect() as connection:
+            df = pd.read_sql(
+                text(query), connection, params=params,
+                dtype_backend="pyarrow", parse_dates=parse_dates
+            )
         return df
+    except Exception as e:
+        # st.stop() raises, so a transient failure is never cached under
+        # the query key as an hour of "no data".
+        st.error(f"Error executing query: {e}")
+        st.stop()
+
+# --- Function to Run a Batch of Queries in One Round-Trip ---
+@st.cache_data(ttl=3600, show_spinner=False)
+def run_query_batch(queries):
+    """
+    Executes several SELECT statements in a single round-trip using MySQL's
+    multi-statement protocol and returns one DataFrame per query, in order.
+    When a page needs a handful of small result sets, the network round-trip
+    dominates each query's cost, so collapsing them into one dispatch makes
+    the page pay a single round-trip instead of one per query.
+    """
+    engine = get_db_engine()
+    raw_connection = None
+    try:
+        raw_connection = engine.raw_connection()
+        cursor = raw_connection.cursor()
+        cursor.execute('; '.join(q.strip().rstrip(';') for q in queries))
+        frames = []
+        while True:
+            columns = [d[0] for d in cursor.description]
+            frames.append(pd.DataFrame(cursor.fetchall(), columns=columns))
+            if not cursor.nextset():
+                break
+        cursor.close()
+        return frames
+    except Exception as e:
+        st.error(f"Error executing batch query: {e}")
+        st.stop()
+    finally:
+        if raw_connection is not None:
+            raw_connection.close()
+
+# --- Function to Fetch a Single Metrics Row ---
+@st.cache_data(ttl=3600, show_spinner=False)
+def run_row(query, params=None):
+    """
+    Executes a query that returns exactly one row and fetches it as a dict
+    of column name to value, skipping DataFrame construction for sections
+    whose whole output is a couple of st.metric calls.
+    """
+    engine = get_db_engine()
+    try:
+        with engine.connect() as connection:
+            row = connection.execute(text(query), params or {}).mappings().first()
+        return dict(row) if row is not None else None
+    except Exception as e:
+        st.error(f"Error executing query: {e}")
+        st.stop()
+
+# --- Function to Fetch a Small Row Sample ---
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_small(query, n=100):
+    """
+    Fetches at most n rows through a raw cursor and builds the DataFrame in
+    a single from_records call. The LIMIT-100 display sections use this
+    instead of run_query because pandas' SQLAlchemy result wrapping costs
+    more than the fetch itself at this size. The result is converted to
+    pyarrow-backed dtypes once here, so every rerun ships the cached Arrow
+    buffers to the browser without re-serializing object columns.
+    """
+    engine = get_db_engine()
+    raw_connection = None
+    try:
+        raw_connection = engine.raw_connection()
+        cursor = raw_connection.cursor()
+        cursor.execute(query)
+        rows = cursor.fetchmany(n)
+        columns = [d[0] for d in cursor.description]
+        cursor.close()
+        df = pd.DataFrame.from_records(rows, columns=columns)
+        return df.convert_dtypes(dtype_backend="pyarrow")
     except Exception as e:
         st.error(f"Error executing query: {e}")
-        return pd.DataFrame()
+        st.stop()
+    finally:
+        if raw_connection is not None:
+            raw_connection.close()
 
-# --- Function to get unique values for filters ---
-@st.cache_data
-def get_unique_column_values(column_name, table_name="ola_rides_tbl"):
+# --- Function to get all filter options in one scan ---
+@st.cache_data(ttl=86400)
+def get_filter_metadata():
+    """
+    Fetches the distinct values of every categorical filter column in a
+    single query, so each new filter widget shares one scan instead of
+    issuing its own SELECT DISTINCT. The GROUP BY has no ORDER BY, so
+    MySQL dedupes with a hash scan instead of a filesort and the short
+    option lists are sorted client-side. Filter options change rarely,
+    so a day-long TTL keeps them cached across sessions while still
+    refreshing eventually.
     """
-    Fetches unique values from a specified column in a given table for use in filters.
+    query = """
+    SELECT
+        Vehicle_Type,
+        Payment_Method,
+        Booking_Status
+    FROM
+        ola_rides_tbl
+    GROUP BY
+        1, 2, 3;
     """
-    query = f"SELECT DISTINCT {column_name} FROM {table_name} ORDER BY {column_name};"
     df = run_query(query)
-    return [str(item) for item in df[column_name].dropna().unique()]
+    return {
+        column: sorted(df[column].dropna().astype(str).unique().tolist())
+        for column in df.columns
+    }
+
+# --- Helper to downsample long time series before charting ---
+def downsample_for_chart(df, x_column, y_column, n_out=1500):
+    """
+    Reduces a time-series DataFrame to at most n_out points with the
+    MinMax-LTTB algorithm so line charts stay responsive as the date range
+    grows. Peaks and valleys are preserved; short series are returned as-is.
+    """
+    if len(df) <= n_out:
+        return df
+    from tsdownsample import MinMaxLTTBDownsampler
+    indices = MinMaxLTTBDownsampler().downsample(
+        df[x_column].astype('int64').values,
+        df[y_column].astype('float64').values,
+        n_out=n_out
+    )
+    return df.iloc[indices]
+
+# --- Helper to cap daily series row counts in SQL ---
+def cap_daily_buckets(daily_query, date_column, value_column, max_buckets=2000):
+    """
+    Wraps a daily aggregate query so MySQL re-buckets the series to at most
+    max_buckets rows before it ever crosses the wire. The bucket width is
+    derived from the date span, so short ranges pass through day-by-day
+    while multi-year ranges collapse into evenly sized multi-day buckets.
+    """
+    inner = daily_query.strip().rstrip(';')
+    return f"""
+    WITH daily AS (
+        {inner}
+    ),
+    bounds AS (
+        SELECT
+            MIN({date_column}) AS first_day,
+            GREATEST(CEIL(DATEDIFF(MAX({date_column}), MIN({date_column})) / {max_buckets}), 1) AS bucket_days
+        FROM daily
+    )
+    SELECT
+        DATE_ADD(bounds.first_day, INTERVAL
+            FLOOR(DATEDIFF(daily.{date_column}, bounds.first_day) / bounds.bucket_days)
+            * bounds.bucket_days DAY) AS {date_column},
+        SUM(daily.{value_column}) AS {value_column}
+    FROM daily CROSS JOIN bounds
+    GROUP BY 1
+    ORDER BY 1;
+    """
+
+# --- Cached Chart Builders ---
+@st.cache_data(show_spinner=False)
+def build_bar_chart(df, x_column, y_column):
+    """
+    Builds a bar chart for a small aggregate DataFrame and caches the
+    resulting figure, so reruns with unchanged data skip both the figure
+    construction and the per-render serialization st.bar_chart performs.
+    """
+    fig = go.Figure(go.Bar(x=df[x_column], y=df[y_column]))
+    fig.update_layout(xaxis_title=x_column, yaxis_title=y_column)
+    return fig
+
+@st.cache_data(show_spinner=False)
+def build_line_chart(df, x_column, y_column):
+    """
+    Builds a WebGL-backed line chart for an already-downsampled time series.
+    Scattergl renders on the GPU, so the browser stays smooth on long date
+    ranges, and caching the figure skips reconstruction on rerun. Combined
+    with downsample_for_chart, the payload sent to the front end stays
+    bounded no matter how large the underlying table grows.
+    """
+    fig = go.Figure(go.Scattergl(
+        x=df[x_column],
+        y=df[y_column],
+        mode='lines',
+        name=y_column
+    ))
+    fig.update_layout(xaxis_title=x_column, yaxis_title=y_column)
+    return fig
+
+@st.cache_data(show_spinner=False)
+def build_pie_chart(df, names_column, values_column, title):
+    """
+    Builds a donut chart directly with graph_objects, skipping the DataFrame
+    introspection Plotly Express performs on every call; the figure is
+    cached so unchanged data skips construction entirely.
+    """
+    fig = go.Figure(data=[go.Pie(
+        labels=df[names_column],
+        values=df[values_column],
+        hole=0.3
+    )])
+    fig.update_layout(title=title)
+    fig.update_traces(textposition='inside', textinfo='percent+label')
+    return fig
+
+# --- Insight Section Queries ---
+# Defined at module level so the renderers and the cache prewarmer below
+# share the exact same strings; a prewarmed result is then a guaranteed
+# cache hit when the user opens the section.
+# WITH ROLLUP appends a NULL-customer row carrying the grand total, so the
+# top five and the denominator for their ride share arrive in one pass.
+top_customers_query = """
+SELECT
+    Customer_ID,
+    COUNT(Booking_ID) AS Total_Rides_Booked
+FROM
+    ola_rides_tbl
+GROUP BY
+    Customer_ID WITH ROLLUP
+ORDER BY
+    Total_Rides_Booked DESC
+LIMIT 6;
+"""
+
+top_customers_by_value_query = """
+SELECT
+    Customer_ID,
+    SUM(booking_value_paise) AS Total_Booking_Value_Paise
+FROM
+    ola_rides_tbl
+WHERE
+    Booking_Status = 'Success'
+GROUP BY
+    Customer_ID
+ORDER BY
+    Total_Booking_Value_Paise DESC
+LIMIT 5;
+"""
+
+avg_ride_distance_query = """
+SELECT
+    Vehicle_Type,
+    SUM(Ride_Distance_Sum) / SUM(Ride_Distance_Count) AS Average_Ride_Distance
+FROM
+    ola_daily_summary
+GROUP BY
+    Vehicle_Type
+ORDER BY
+    Average_Ride_Distance DESC;
+"""
+
+reasons_query = """
+SELECT
+    Canceled_Rides_by_Driver,
+    COUNT(*) AS Total_Count
+FROM
+    ola_rides_tbl
+WHERE
+    Is_Driver_Canceled = TRUE
+    AND MATCH(Canceled_Rides_by_Driver)
+        AGAINST('personal car vehicle breakdown maintenance' IN BOOLEAN MODE)
+GROUP BY
+    Canceled_Rides_by_Driver
+ORDER BY
+    Total_Count DESC;
+"""
+
+trend_query = """
+SELECT
+    ride_date AS Cancellation_Date,
+    COUNT(*) AS Total_Cancellations
+FROM
+    ola_rides_tbl
+WHERE
+    Is_Driver_Canceled = TRUE
+    AND MATCH(Canceled_Rides_by_Driver)
+        AGAINST('personal car vehicle breakdown maintenance' IN BOOLEAN MODE)
+GROUP BY
+    Cancellation_Date
+ORDER BY
+    Cancellation_Date;
+"""
+trend_query = cap_daily_buckets(trend_query, 'Cancellation_Date', 'Total_Cancellations')
+
+revenue_by_method_query = """
+SELECT
+    Payment_Method,
+    SUM(Booking_Value_Paise_Sum) AS Total_Revenue_Paise
+FROM
+    ola_daily_summary
+WHERE
+    Booking_Status = 'Success'
+GROUP BY
+    Payment_Method
+ORDER BY
+    Total_Revenue_Paise DESC;
+"""
+
+upi_rides_query = """
+SELECT
+    Booking_ID,
+    Customer_ID,
+    Vehicle_Type,
+    Pickup_Location,
+    Drop_Location,
+    Booking_Value,
+    Ride_Distance,
+    Timestamp
+FROM
+    ola_rides_tbl
+WHERE
+    Payment_Method = 'UPI'
+ORDER BY
+    Timestamp DESC
+LIMIT 100; -- Limiting to 100 rows for display efficiency in Streamlit
+"""
+
+upi_trend_query = """
+SELECT
+    Ride_Date,
+    SUM(Total_Rides) AS Total_UPI_Rides
+FROM
+    ola_daily_summary
+WHERE
+    Payment_Method = 'UPI'
+GROUP BY
+    Ride_Date
+ORDER BY
+    Ride_Date;
+"""
+upi_trend_query = cap_daily_buckets(upi_trend_query, 'Ride_Date', 'Total_UPI_Rides')
+
+upi_value_query = """
+SELECT
+    AVG(booking_value_paise) AS Average_UPI_Booking_Value_Paise
+FROM
+    ola_rides_tbl
+WHERE
+    Payment_Method = 'UPI'
+    AND Booking_Status = 'Success';
+"""
+
+ratings_query = """
+SELECT
+    MAX(Driver_Ratings) AS Max_Driver_Rating,
+    MIN(Driver_Ratings) AS Min_Driver_Rating
+FROM
+    ola_rides_tbl
+WHERE
+    Vehicle_Type = 'Prime Sedan';
+"""
+
+incomplete_rides_query = """
+SELECT
+    Booking_ID,
+    Incomplete_Rides_Reason
+FROM
+    ola_rides_tbl
+WHERE
+    Is_Incomplete = TRUE
+LIMIT 100; -- Limiting to 100 rows for display efficiency in Streamlit
+"""
+
+incomplete_reasons_query = """
+SELECT
+    Incomplete_Rides_Reason,
+    COUNT(*) AS Total_Count
+FROM
+    ola_rides_tbl
+WHERE
+    Is_Incomplete = TRUE
+GROUP BY
+    Incomplete_Rides_Reason
+ORDER BY
+    Total_Count DESC;
+"""
+
+cancellations_query = """
+SELECT
+    SUM((Booking_Status = 'Canceled by Customer') * Total_Rides) AS Total_Customer_Cancelled_Rides,
+    SUM((Is_Incomplete = TRUE) * Total_Rides) AS Total_Incomplete_Rides
+FROM
+    ola_daily_summary;
+"""
+
+successful_bookings_query = """
+SELECT
+    Booking_ID,
+    Customer_ID,
+    Vehicle_Type,
+    Pickup_Location,
+    Drop_Location,
+    Booking_Value,
+    Payment_Method,
+    Ride_Distance,
+    Timestamp
+FROM
+    ola_rides_tbl
+WHERE
+    Booking_Status = 'Success'
+ORDER BY
+    Timestamp DESC
+LIMIT 100; -- Limiting to 100 rows for display efficiency in Streamlit
+"""
+
+# --- Shared Fetchers for Related Insight Sections ---
+# The two driver-cancellation sections scan the same filtered rowset, as
+# do the UPI trend and average-value sections. Fetching each pair through
+# one run_query_batch call means the related sections share a single
+# round-trip and cache entry: whichever section renders first pays for
+# the scan, the other reads the result back from memory.
+
+def fetch_driver_cancellation_frames():
+    reasons_df, trend_df = run_query_batch((reasons_query, trend_query))
+    if not trend_df.empty:
+        trend_df['Cancellation_Date'] = pd.to_datetime(trend_df['Cancellation_Date'])
+    return reasons_df, trend_df
+
+def fetch_upi_frames():
+    upi_trend_df, upi_value_df = run_query_batch((upi_trend_query, upi_value_query))
+    if not upi_trend_df.empty:
+        upi_trend_df['Ride_Date'] = pd.to_datetime(upi_trend_df['Ride_Date'])
+    avg_value = None
+    if not upi_value_df.empty and pd.notna(upi_value_df.iat[0, 0]):
+        avg_value = upi_value_df.iat[0, 0]
+    return upi_trend_df, avg_value
+
+# Static queries the background prewarmer runs through run_query. The
+# vehicle-type rating query is excluded because it is parameterized by
+# the selectbox; the driver-cancellation and UPI pairs are warmed through
+# their shared batch fetchers.
+PREWARM_QUERIES = [
+    top_customers_query,
+    top_customers_by_value_query,
+    avg_ride_distance_query,
+    revenue_by_method_query,
+    incomplete_reasons_query,
+]
+
+# Single-row metric queries go through run_row, which has its own cache.
+PREWARM_ROW_QUERIES = [
+    ratings_query,
+    cancellations_query,
+]
+
+# Row-listing queries go through fetch_small, which has its own cache.
+PREWARM_LISTING_QUERIES = [
+    upi_rides_query,
+    incomplete_rides_query,
+    successful_bookings_query,
+]
+
+def _prewarm_insight_cache():
+    """
+    Warms run_query's cache for every static insight query so that by the
+    time the user navigates to the Insights page, each section is served
+    from memory instead of waiting on MySQL.
+    """
+    for query in PREWARM_QUERIES:
+        run_query(query)
+    fetch_driver_cancellation_frames()
+    fetch_upi_frames()
+    for query in PREWARM_LISTING_QUERIES:
+        fetch_small(query)
+    for query in PREWARM_ROW_QUERIES:
+        run_row(query)
+
+# Shared display formatting for the 100-row ride listing tables; keys for
+# columns a given listing lacks are simply ignored.
+LISTING_COLUMN_CONFIG = {
+    'Booking_Value': st.column_config.NumberColumn('Booking Value', format='₹%.2f'),
+    'Ride_Distance': st.column_config.NumberColumn('Ride Distance', format='%.1f km'),
+    'Timestamp': st.column_config.DatetimeColumn('Timestamp', format='YYYY-MM-DD HH:mm'),
+}
+
+# --- Insight Section Renderers ---
+# Each section is its own fragment, so choosing a section in the sidebar
+# reruns only that function instead of re-executing the whole script.
+
+@st.fragment
+def render_top_customers_by_rides():
+    st.header("📊 Top 5 Customers by Total Rides Booked")
+    top_customers_df = run_query(top_customers_query)
+    if not top_customers_df.empty:
+        # Split off the ROLLUP grand-total row and use it to express each
+        # customer's rides as a share of all rides.
+        total_rides = top_customers_df.loc[
+            top_customers_df['Customer_ID'].isna(), 'Total_Rides_Booked'
+        ].max()
+        top_customers_df = top_customers_df.dropna(subset=['Customer_ID'])
+        if pd.notna(total_rides) and total_rides:
+            top_customers_df['Share_of_All_Rides_%'] = (
+                top_customers_df['Total_Rides_Booked'] / total_rides * 100
+            ).round(2)
+        st.dataframe(top_customers_df, use_container_width=True)
+        st.plotly_chart(
+            build_bar_chart(top_customers_df, 'Customer_ID', 'Total_Rides_Booked'),
+            use_container_width=True
+        )
+    else:
+        st.info("No data available for Top 5 Customers.")
+
+@st.fragment
+def render_top_customers_by_revenue():
+    st.header("👑 Top 5 Customers by Total Booking Value")
+    top_customers_by_value_df = run_query(top_customers_by_value_query)
+    if not top_customers_by_value_df.empty:
+        # Convert the exact paise sums back to rupees for display.
+        top_customers_by_value_df['Total_Booking_Value'] = (
+            top_customers_by_value_df.pop('Total_Booking_Value_Paise') / 100.0
+        )
+        st.dataframe(top_customers_by_value_df, use_container_width=True)
+        st.plotly_chart(
+            build_bar_chart(top_customers_by_value_df, 'Customer_ID', 'Total_Booking_Value'),
+            use_container_width=True
+        )
+    else:
+        st.info("No successful rides found to identify top customers by value.")
+
+@st.fragment
+def render_avg_ratings_by_vehicle_type():
+    st.header("⭐ Average Customer Ratings by Vehicle Type")
+    vehicle_types = get_filter_metadata()['Vehicle_Type']
+    selected_vehicle_type = st.selectbox(
+        "Select Vehicle Type for Average Rating:",
+        ["All"] + vehicle_types,
+        index=0
+    )
+    avg_customer_rating_query = """
+    SELECT
+        Vehicle_Type,
+        ROUND(SUM(Customer_Rating_Sum) / SUM(Customer_Rating_Count), 2) AS Average_Customer_Rating
+    FROM
+        ola_daily_summary
+    WHERE
+        Customer_Rating_Count > 0
+        AND (:vt IS NULL OR Vehicle_Type = :vt)
+    GROUP BY
+        Vehicle_Type
+    ORDER BY
+        Average_Customer_Rating DESC;
+    """
+    # NULL means "no filter", so the SQL string stays identical across
+    # selections and only the bound value changes.
+    avg_customer_rating_df = run_query(
+        avg_customer_rating_query,
+        params={"vt": None if selected_vehicle_type == "All" else selected_vehicle_type}
+    )
+    if not avg_customer_rating_df.empty:
+        st.dataframe(avg_customer_rating_df, use_container_width=True)
+        st.plotly_chart(
+            build_bar_chart(avg_customer_rating_df, 'Vehicle_Type', 'Average_Customer_Rating'),
+            use_container_width=True
+        )
+    else:
+        st.info("No data available for Average Customer Ratings by Vehicle Type with current filters.")
+
+@st.fragment
+def render_avg_ride_distance_by_vehicle_type():
+    st.header("📏 Average Ride Distance by Vehicle Type")
+    avg_ride_distance_df = run_query(avg_ride_distance_query)
+
+    if not avg_ride_distance_df.empty:
+        st.dataframe(avg_ride_distance_df, use_container_width=True)
+
+        st.subheader("Average Ride Distance by Vehicle Type (Horizontal Bar Chart)")
+        # Hand-built go.Bar instead of px.bar: plotly.express pays a fixed
+        # DataFrame-introspection cost per call that dwarfs rendering a
+        # handful of bars.
+        distances = avg_ride_distance_df['Average_Ride_Distance']
+        fig_horizontal_bar = go.Figure(go.Bar(
+            x=distances,
+            y=avg_ride_distance_df['Vehicle_Type'],
+            orientation='h', # This makes it horizontal
+            marker={'color': distances, 'colorscale': 'Plasma'}, # Color bars by distance for emphasis
+        ))
+        fig_horizontal_bar.update_layout(
+            title='Average Ride Distance by Vehicle Type',
+            xaxis_title='Average Distance (km)',
+            yaxis_title='Vehicle Type',
+            showlegend=False, # Hide color bar legend if not necessary
+        )
+        st.plotly_chart(fig_horizontal_bar, use_container_width=True)
+    else:
+        st.info("No data available for Average Ride Distance by Vehicle Type.")
+
+@st.fragment
+def render_driver_cancellation_reasons():
+    st.header("🚫 Breakdown of Driver Cancellation Reasons")
+    reasons_df, _ = fetch_driver_cancellation_frames()
+    if not reasons_df.empty:
+        st.dataframe(reasons_df, use_container_width=True)
+        st.plotly_chart(
+            build_bar_chart(reasons_df, 'Canceled_Rides_by_Driver', 'Total_Count'),
+            use_container_width=True
+        )
+    else:
+        st.info("No specific reasons found for these driver cancellations.")
+
+@st.fragment
+def render_driver_cancellation_trend():
+    st.header("📈 Driver Cancellation Trend (Personal/Car Issues)")
+    _, trend_df = fetch_driver_cancellation_frames()
+    if not trend_df.empty:
+        trend_df = downsample_for_chart(trend_df, 'Cancellation_Date', 'Total_Cancellations')
+        st.plotly_chart(
+            build_line_chart(trend_df, 'Cancellation_Date', 'Total_Cancellations'),
+            use_container_width=True
+        )
+    else:
+        st.info("No data available to show driver cancellation trends.")
+
+@st.fragment
+def render_revenue_by_payment_method():
+    st.header("💰 Revenue by Payment Method")
+    revenue_by_method_df = run_query(revenue_by_method_query)
+    if not revenue_by_method_df.empty:
+        # Revenue is aggregated in exact integer paise; convert to rupees
+        # once for display.
+        revenue_by_method_df['Total_Revenue'] = (
+            revenue_by_method_df.pop('Total_Revenue_Paise') / 100.0
+        )
+        st.dataframe(revenue_by_method_df, use_container_width=True)
+        st.plotly_chart(
+            build_bar_chart(revenue_by_method_df, 'Payment_Method', 'Total_Revenue'),
+            use_container_width=True
+        )
+    else:
+        st.info("No successful ride data available to calculate revenue.")
+
+@st.fragment
+def render_upi_rides():
+    st.header("📈 Payment done through UPI")
+    st.markdown("Displays all rides where the payment method was 'UPI'.")
+
+    upi_rides_df = fetch_small(upi_rides_query)
+
+    if not upi_rides_df.empty:
+        st.dataframe(upi_rides_df, use_container_width=True, hide_index=True,
+                     column_config=LISTING_COLUMN_CONFIG)
+        st.info("Displayed the first 100 UPI-paid rides for performance.")
+    else:
+        st.info("No rides found with UPI as the payment method.")
+    st.markdown("---")
+
+@st.fragment
+def render_upi_usage_trend():
+    st.header("📈 UPI Usage Trend Over Time")
+    upi_trend_df, _ = fetch_upi_frames()
+    if not upi_trend_df.empty:
+        upi_trend_df = downsample_for_chart(upi_trend_df, 'Ride_Date', 'Total_UPI_Rides')
+        st.plotly_chart(
+            build_line_chart(upi_trend_df, 'Ride_Date', 'Total_UPI_Rides'),
+            use_container_width=True
+        )
+    else:
+        st.info("No UPI ride data available to show trends.")
+
+@st.fragment
+def render_avg_upi_booking_value():
+    st.header("💰 Average Booking Value for UPI Rides")
+    _, avg_value = fetch_upi_frames()
+    if avg_value is not None:
+        st.metric(label="Average Booking Value for UPI", value=f"₹{avg_value / 100:,.2f}")
+    else:
+        st.info("No successful UPI rides found to calculate average booking value.")
+
+@st.fragment
+def render_prime_sedan_driver_ratings():
+    st.header("⭐ Driver Ratings for Prime Sedan Bookings")
+    ratings_row = run_row(ratings_query)
+    if ratings_row is not None and ratings_row['Max_Driver_Rating'] is not None:
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric(label="Maximum Driver Rating", value=ratings_row['Max_Driver_Rating'])
+        with col2:
+            st.metric(label="Minimum Driver Rating", value=ratings_row['Min_Driver_Rating'])
+        st.markdown("### Comparison of Ratings")
+        # Two bars don't need px.bar's DataFrame plumbing; build the trace
+        # directly from the metric row.
+        fig = go.Figure(go.Bar(
+            x=['Max_Driver_Rating', 'Min_Driver_Rating'],
+            y=[ratings_row['Max_Driver_Rating'], ratings_row['Min_Driver_Rating']],
+            marker_color=['#636efa', '#ef553b'],
+        ))
+        fig.update_layout(
+            title='Max vs. Min Driver Ratings for Prime Sedan',
+            yaxis_title='Rating',
+            showlegend=False,
+        )
+        st.plotly_chart(fig, use_container_width=True)
+    else:
+        st.info("No Prime Sedan booking data available to calculate ratings.")
+
+@st.fragment
+def render_incomplete_ride_reasons():
+    st.header("📊 Distribution of Incomplete Ride Reasons")
+
+    # Both queries filter the same Is_Incomplete rows, so run them
+    # concurrently instead of paying for two sequential scans.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        rides_future = executor.submit(fetch_small, incomplete_rides_query)
+        reasons_future = executor.submit(run_query, incomplete_reasons_query)
+        incomplete_rides_df = rides_future.result()
+        incomplete_reasons_df = reasons_future.result()
+
+    if not incomplete_rides_df.empty:
+        st.dataframe(incomplete_rides_df, use_container_width=True, hide_index=True,
+                     column_config=LISTING_COLUMN_CONFIG)
+        st.info("Displayed the first 100 incomplete rides for performance.")
+    else:
+        st.info("No incomplete rides found.")
+
+    if not incomplete_reasons_df.empty:
+        fig = build_pie_chart(
+            incomplete_reasons_df,
+            'Incomplete_Rides_Reason',
+            'Total_Count',
+            'Distribution of Incomplete Ride Reasons'
+        )
+        st.plotly_chart(fig, use_container_width=True)
+    else:
+        st.info("No incomplete rides found to generate the pie chart.")
+
+@st.fragment
+def render_total_cancellations():
+    st.header("Total Cancellations & Incomplete Rides")
+    # Both counts are fetched in one query to avoid scanning the table twice.
+    cancellations_row = run_row(cancellations_query)
+    col1, col2 = st.columns(2)
+    if cancellations_row is not None:
+        with col1:
+            st.metric(
+                label="Total Rides Cancelled by Customers",
+                value=int(cancellations_row['Total_Customer_Cancelled_Rides'] or 0)
+            )
+        with col2:
+            st.metric(
+                label="Total Incomplete Rides",
+                value=int(cancellations_row['Total_Incomplete_Rides'] or 0)
+            )
+    else:
+        st.info("No cancellation data available.")
+
+@st.fragment
+def render_successful_bookings():
+    st.header("All Successful Ola Bookings")
+    successful_bookings_df = fetch_small(successful_bookings_query)
+
+    if not successful_bookings_df.empty:
+        st.dataframe(successful_bookings_df, use_container_width=True, hide_index=True,
+                     column_config=LISTING_COLUMN_CONFIG)
+        st.info("Displayed the first 100 successful bookings for performance.")
+    else:
+        st.info("No successful bookings found.")
+    st.markdown("---")
+
+# Maps each sidebar label to the fragment that renders it.
+INSIGHT_SECTIONS = {
+    "Top Customers by Rides": render_top_customers_by_rides,
+    "Top Customers by Revenue": render_top_customers_by_revenue,
+    "Average Ratings by Vehicle Type": render_avg_ratings_by_vehicle_type,
+    "Average Ride Distance by Vehicle Type": render_avg_ride_distance_by_vehicle_type,
+    "Driver Cancellation Reasons": render_driver_cancellation_reasons,
+    "Driver Cancellation Trend": render_driver_cancellation_trend,
+    "Revenue by Payment Method": render_revenue_by_payment_method,
+    "Rides Paid via UPI": render_upi_rides,
+    "UPI Usage Trend": render_upi_usage_trend,
+    "Average UPI Booking Value": render_avg_upi_booking_value,
+    "Prime Sedan Driver Ratings": render_prime_sedan_driver_ratings,
+    "Incomplete Ride Reasons": render_incomplete_ride_reasons,
+    "Total Cancellations": render_total_cancellations,
+    "Successful Bookings": render_successful_bookings,
+}
+
+@st.fragment
+def render_home_overview():
+    """
+    The Home page's KPI and at-a-glance block, isolated as a fragment so
+    interactions inside it rerun only this function, like the insight
+    sections.
+    """
+    # All three KPIs come from a single aggregate query so the page pays one
+    # database round-trip instead of three.
+    kpi_query = """
+    SELECT
+        COUNT(*) AS Total_Rides,
+        SUM(Booking_Status = 'Success') AS Successful_Rides,
+        SUM(CASE WHEN Booking_Status = 'Success' THEN booking_value_paise ELSE 0 END) AS Total_Revenue_Paise
+    FROM
+        ola_rides_tbl;
+    """
+    booking_status_query = """
+    SELECT
+        Booking_Status,
+        SUM(Total_Rides) AS Total_Bookings
+    FROM
+        ola_daily_summary
+    GROUP BY
+        Booking_Status;
+    """
+    ride_volume_query = """
+    SELECT
+        Ride_Date,
+        SUM(Total_Rides) AS Daily_Rides
+    FROM
+        ola_daily_summary
+    GROUP BY
+        Ride_Date
+    ORDER BY
+        Ride_Date;
+    """
+    ride_volume_query = cap_daily_buckets(ride_volume_query, 'Ride_Date', 'Daily_Rides')
+
+    # The three Home page queries travel to MySQL as one multi-statement
+    # batch, so the page pays a single round-trip instead of three.
+    kpi_df, booking_status_df, ride_volume_df = run_query_batch(
+        (kpi_query, booking_status_query, ride_volume_query)
+    )
+
+    # --- Home Page Key Metrics ---
+    st.header("Key Performance Indicators")
+    if not kpi_df.empty:
+        col1, col2, col3 = st.columns(3)
+
+        kpi_row = kpi_df.iloc[0]
+        col1.metric(label="Total Rides", value=f"{int(kpi_row['Total_Rides']):,}")
+        col2.metric(label="Successful Rides", value=f"{int(kpi_row['Successful_Rides']):,}")
+        col3.metric(label="Total Revenue", value=f"₹{kpi_row['Total_Revenue_Paise'] / 100:,.2f}")
+    else:
+        st.info("No ride data available to calculate KPIs.")
+
+    st.markdown("---")
+
+    # --- At-a-Glance Visualizations ---
+    st.header("At-a-Glance Insights")
+
+    col_a, col_b = st.columns(2)
+
+    with col_a:
+        st.subheader("Booking Status Distribution")
+        if not booking_status_df.empty:
+            fig = build_pie_chart(
+                booking_status_df,
+                'Booking_Status',
+                'Total_Bookings',
+                'Overall Ride Outcome Distribution'
+            )
+            st.plotly_chart(fig, use_container_width=True)
+
+    with col_b:
+        st.subheader("Ride Volume Over Time")
+        if not ride_volume_df.empty:
+            ride_volume_df['Ride_Date'] = pd.to_datetime(ride_volume_df['Ride_Date'])
+            ride_volume_df = downsample_for_chart(ride_volume_df, 'Ride_Date', 'Daily_Rides')
+            st.plotly_chart(
+                build_line_chart(ride_volume_df, 'Ride_Date', 'Daily_Rides'),
+                use_container_width=True
+            )
 
 # --- Set Streamlit Page Configuration ---
 st.set_page_config(
@@ -108,493 +984,21 @@ if page == "Home":
         ---
     """)
 
-    # --- Home Page Key Metrics ---
-    st.header("Key Performance Indicators")
-    col1, col2, col3 = st.columns(3)
-
-    # Total Rides Metric
-    total_rides_query = "SELECT COUNT(*) FROM ola_rides_tbl;"
-    total_rides = run_query(total_rides_query).iloc[0, 0]
-    col1.metric(label="Total Rides", value=f"{total_rides:,}")
-
-    # Total Successful Rides Metric
-    successful_rides_query = "SELECT COUNT(*) FROM ola_rides_tbl WHERE Booking_Status = 'Success';"
-    successful_rides = run_query(successful_rides_query).iloc[0, 0]
-    col2.metric(label="Successful Rides", value=f"{successful_rides:,}")
-
-    # Total Revenue Metric
-    total_revenue_query = "SELECT SUM(Booking_Value) FROM ola_rides_tbl WHERE Booking_Status = 'Success';"
-    total_revenue = run_query(total_revenue_query).iloc[0, 0]
-    col3.metric(label="Total Revenue", value=f"₹{total_revenue:,.2f}")
-
-    st.markdown("---")
-
-    # --- At-a-Glance Visualizations ---
-    st.header("At-a-Glance Insights")
-
-    col_a, col_b = st.columns(2)
-
-    with col_a:
-        st.subheader("Booking Status Distribution")
-        booking_status_query = """
-        SELECT
-            Booking_Status,
-            COUNT(Booking_ID) AS Total_Bookings
-        FROM
-            ola_rides_tbl
-        GROUP BY
-            Booking_Status;
-        """
-        booking_status_df = run_query(booking_status_query)
-        if not booking_status_df.empty:
-            fig = px.pie(
-                booking_status_df,
-                values='Total_Bookings',
-                names='Booking_Status',
-                title='Overall Ride Outcome Distribution',
-                hole=0.3
-            )
-            fig.update_traces(textposition='inside', textinfo='percent+label')
-            st.plotly_chart(fig, use_container_width=True)
+    render_home_overview()
 
-    with col_b:
-        st.subheader("Ride Volume Over Time")
-        ride_volume_query = """
-        SELECT
-            DATE(Timestamp) AS Ride_Date,
-            COUNT(Booking_ID) AS Daily_Rides
-        FROM
-            ola_rides_tbl
-        GROUP BY
-            DATE(Timestamp)
-        ORDER BY
-            Ride_Date;
-        """
-        ride_volume_df = run_query(ride_volume_query)
-        if not ride_volume_df.empty:
-            ride_volume_df['Ride_Date'] = pd.to_datetime(ride_volume_df['Ride_Date'])
-            st.line_chart(ride_volume_df.set_index('Ride_Date'))
+    # Warm the insight caches in the background while the user is still
+    # reading the Home page, so the Insights sections open instantly.
+    if not st.session_state.get('insights_prewarmed'):
+        st.session_state['insights_prewarmed'] = True
+        threading.Thread(target=_prewarm_insight_cache, daemon=True).start()
 
 elif page == "Insights":
     st.title("📊 Detailed OLA Ride Insights Dashboard")
 
     # --- Left-side Radio Button Navigation for Insights Page ---
     st.sidebar.title("Insights Navigation")
-    insight_selection = st.sidebar.radio("Jump to Section:", [
-        "Top Customers by Rides",
-        "Top Customers by Revenue",
-        "Average Ratings by Vehicle Type",
-        "Average Ride Distance by Vehicle Type",
-        "Driver Cancellation Reasons",
-        "Driver Cancellation Trend",
-        "Revenue by Payment Method",
-        "Rides Paid via UPI",
-        "UPI Usage Trend",
-        "Average UPI Booking Value",
-        "Prime Sedan Driver Ratings",
-        "Incomplete Ride Reasons",
-        "Total Cancellations",
-        "Successful Bookings"
-    ])
-
-    if insight_selection == "Top Customers by Rides":
-        st.header("📊 Top 5 Customers by Total Rides Booked")
-        top_customers_query = """
-        SELECT
-            Customer_ID,
-            COUNT(Booking_ID) AS Total_Rides_Booked
-        FROM
-            ola_rides_tbl
-        GROUP BY
-            Customer_ID
-        ORDER BY
-            Total_Rides_Booked DESC
-        LIMIT 5;
-        """
-        top_customers_df = run_query(top_customers_query)
-        if not top_customers_df.empty:
-            st.dataframe(top_customers_df, use_container_width=True)
-            st.bar_chart(top_customers_df.set_index('Customer_ID'))
-        else:
-            st.info("No data available for Top 5 Customers.")
-
-    elif insight_selection == "Top Customers by Revenue":
-        st.header("👑 Top 5 Customers by Total Booking Value")
-        top_customers_by_value_query = """
-        SELECT
-            Customer_ID,
-            SUM(Booking_Value) AS Total_Booking_Value
-        FROM
-            ola_rides_tbl
-        WHERE
-            Booking_Status = 'Success'
-        GROUP BY
-            Customer_ID
-        ORDER BY
-            Total_Booking_Value DESC
-        LIMIT 5;
-        """
-        top_customers_by_value_df = run_query(top_customers_by_value_query)
-        if not top_customers_by_value_df.empty:
-            st.dataframe(top_customers_by_value_df, use_container_width=True)
-            st.bar_chart(top_customers_by_value_df.set_index('Customer_ID'))
-        else:
-            st.info("No successful rides found to identify top customers by value.")
-
-    elif insight_selection == "Average Ratings by Vehicle Type":
-        st.header("⭐ Average Customer Ratings by Vehicle Type")
-        vehicle_types = get_unique_column_values("Vehicle_Type")
-        selected_vehicle_type = st.selectbox(
-            "Select Vehicle Type for Average Rating:",
-            ["All"] + vehicle_types,
-            index=0
-        )
-        avg_customer_rating_query = f"""
-        SELECT
-            Vehicle_Type,
-            AVG(Customer_Rating) AS Average_Customer_Rating
-        FROM
-            ola_rides_tbl
-        WHERE
-            Customer_Rating IS NOT NULL
-        """
-        if selected_vehicle_type != "All":
-            avg_customer_rating_query += f" AND Vehicle_Type = '{selected_vehicle_type.replace("'", "''")}'"
-        avg_customer_rating_query += """
-        GROUP BY
-            Vehicle_Type
-        ORDER BY
-            Average_Customer_Rating DESC;
-        """
-        avg_customer_rating_df = run_query(avg_customer_rating_query)
-        if not avg_customer_rating_df.empty:
-            st.dataframe(avg_customer_rating_df, use_container_width=True)
-            st.bar_chart(avg_customer_rating_df.set_index('Vehicle_Type'))
-        else:
-            st.info("No data available for Average Customer Ratings by Vehicle Type with current filters.")
-
-    elif insight_selection == "Average Ride Distance by Vehicle Type":
-        st.header("📏 Average Ride Distance by Vehicle Type")
-        avg_ride_distance_query = """
-        SELECT
-            Vehicle_Type,
-            AVG(Ride_Distance) AS Average_Ride_Distance
-        FROM
-            ola_rides_tbl
-        GROUP BY
-            Vehicle_Type
-        ORDER BY
-            Average_Ride_Distance DESC;
-        """
-        avg_ride_distance_df = run_query(avg_ride_distance_query)
-
-        if not avg_ride_distance_df.empty:
-            st.dataframe(avg_ride_distance_df, use_container_width=True)
-
-            st.subheader("Average Ride Distance by Vehicle Type (Horizontal Bar Chart)")
-            fig_horizontal_bar = px.bar(
-                avg_ride_distance_df,
-                x='Average_Ride_Distance',
-                y='Vehicle_Type',
-                orientation='h', # This makes it horizontal
-                title='Average Ride Distance by Vehicle Type',
-                labels={'Average_Ride_Distance': 'Average Distance (km)', 'Vehicle_Type': 'Vehicle Type'},
-                color='Average_Ride_Distance', # Color bars by distance for emphasis
-                color_continuous_scale=px.colors.sequential.Plasma # Or another color scale
-            )
-            fig_horizontal_bar.update_layout(showlegend=False) # Hide color bar legend if not necessary
-            st.plotly_chart(fig_horizontal_bar, use_container_width=True)
-        else:
-            st.info("No data available for Average Ride Distance by Vehicle Type.")
-
-    elif insight_selection == "Driver Cancellation Reasons":
-        st.header("🚫 Breakdown of Driver Cancellation Reasons")
-        reasons_query = """
-        SELECT
-            Canceled_Rides_by_Driver,
-            COUNT(*) AS Total_Count
-        FROM
-            ola_rides_tbl
-        WHERE
-            Is_Driver_Canceled = TRUE
-            AND (
-                Canceled_Rides_by_Driver LIKE '%%personal%%'
-                OR Canceled_Rides_by_Driver LIKE '%%car%%'
-                OR Canceled_Rides_by_Driver LIKE '%%vehicle%%'
-                OR Canceled_Rides_by_Driver LIKE '%%breakdown%%'
-                OR Canceled_Rides_by_Driver LIKE '%%maintenance%%'
-            )
-        GROUP BY
-            Canceled_Rides_by_Driver
-        ORDER BY
-            Total_Count DESC;
-        """
-        reasons_df = run_query(reasons_query)
-        if not reasons_df.empty:
-            st.dataframe(reasons_df, use_container_width=True)
-            st.bar_chart(reasons_df.set_index('Canceled_Rides_by_Driver'))
-        else:
-            st.info("No specific reasons found for these driver cancellations.")
-
-    elif insight_selection == "Driver Cancellation Trend":
-        st.header("📈 Driver Cancellation Trend (Personal/Car Issues)")
-        trend_query = """
-        SELECT
-            DATE(Timestamp) AS Cancellation_Date,
-            COUNT(*) AS Total_Cancellations
-        FROM
-            ola_rides_tbl
-        WHERE
-            Is_Driver_Canceled = TRUE
-            AND (
-                Canceled_Rides_by_Driver LIKE '%%personal%%'
-                OR Canceled_Rides_by_Driver LIKE '%%car%%'
-                OR Canceled_Rides_by_Driver LIKE '%%vehicle%%'
-                OR Canceled_Rides_by_Driver LIKE '%%breakdown%%'
-                OR Canceled_Rides_by_Driver LIKE '%%maintenance%%'
-            )
-        GROUP BY
-            Cancellation_Date
-        ORDER BY
-            Cancellation_Date;
-        """
-        trend_df = run_query(trend_query)
-        if not trend_df.empty:
-            trend_df['Cancellation_Date'] = pd.to_datetime(trend_df['Cancellation_Date'])
-            st.line_chart(trend_df.set_index('Cancellation_Date'))
-        else:
-            st.info("No data available to show driver cancellation trends.")
-
-    elif insight_selection == "Revenue by Payment Method":
-        st.header("💰 Revenue by Payment Method")
-        revenue_by_method_query = """
-        SELECT
-            Payment_Method,
-            SUM(Booking_Value) AS Total_Revenue
-        FROM
-            ola_rides_tbl
-        WHERE
-            Booking_Status = 'Success'
-        GROUP BY
-            Payment_Method
-        ORDER BY
-            Total_Revenue DESC;
-        """
-        revenue_by_method_df = run_query(revenue_by_method_query)
-        if not revenue_by_method_df.empty:
-            st.dataframe(revenue_by_method_df, use_container_width=True)
-            st.bar_chart(revenue_by_method_df.set_index('Payment_Method'))
-        else:
-            st.info("No successful ride data available to calculate revenue.")
-
-
-    elif insight_selection == "Rides Paid via UPI":
-        st.header("📈 Payment done through UPI")
-        st.markdown("Displays all rides where the payment method was 'UPI'.")
-
-        upi_rides_query = """
-        SELECT
-            Booking_ID,
-            Customer_ID,
-            Vehicle_Type,
-            Pickup_Location,
-            Drop_Location,
-            Booking_Value,
-            Ride_Distance,
-            Timestamp
-        FROM
-            ola_rides_tbl
-        WHERE
-            Payment_Method = 'UPI'
-        LIMIT 100; -- Limiting to 100 rows for display efficiency in Streamlit
-        """
-        upi_rides_df = run_query(upi_rides_query)
-
-        if not upi_rides_df.empty:
-            st.dataframe(upi_rides_df, use_container_width=True)
-            st.info("Displayed the first 100 UPI-paid rides for performance.")
-        else:
-            st.info("No rides found with UPI as the payment method.")
-        st.markdown("---")
-
-    elif insight_selection == "UPI Usage Trend":
-        st.header("📈 UPI Usage Trend Over Time")
-        upi_trend_query = """
-        SELECT
-            DATE(Timestamp) AS Ride_Date,
-            COUNT(*) AS Total_UPI_Rides
-        FROM
-            ola_rides_tbl
-        WHERE
-            Payment_Method = 'UPI'
-        GROUP BY
-            Ride_Date
-        ORDER BY
-            Ride_Date;
-        """
-        upi_trend_df = run_query(upi_trend_query)
-        if not upi_trend_df.empty:
-            upi_trend_df['Ride_Date'] = pd.to_datetime(upi_trend_df['Ride_Date'])
-            st.line_chart(upi_trend_df.set_index('Ride_Date'))
-        else:
-            st.info("No UPI ride data available to show trends.")
-
-    elif insight_selection == "Average UPI Booking Value":
-        st.header("💰 Average Booking Value for UPI Rides")
-        upi_value_query = """
-        SELECT
-            AVG(Booking_Value) AS Average_UPI_Booking_Value
-        FROM
-            ola_rides_tbl
-        WHERE
-            Payment_Method = 'UPI'
-            AND Booking_Status = 'Success';
-        """
-        upi_value_df = run_query(upi_value_query)
-        if not upi_value_df.empty and upi_value_df.iloc[0, 0] is not None:
-            avg_value = upi_value_df.iloc[0, 0]
-            st.metric(label="Average Booking Value for UPI", value=f"₹{avg_value:,.2f}")
-        else:
-            st.info("No successful UPI rides found to calculate average booking value.")
-
-    elif insight_selection == "Prime Sedan Driver Ratings":
-        st.header("⭐ Driver Ratings for Prime Sedan Bookings")
-        ratings_query = """
-        SELECT
-            MAX(Driver_Ratings) AS Max_Driver_Rating,
-            MIN(Driver_Ratings) AS Min_Driver_Rating
-        FROM
-            ola_rides_tbl
-        WHERE
-            Vehicle_Type = 'Prime Sedan';
-        """
-        ratings_df = run_query(ratings_query)
-        if not ratings_df.empty and ratings_df.iloc[0]['Max_Driver_Rating'] is not None:
-            col1, col2 = st.columns(2)
-            with col1:
-                st.metric(label="Maximum Driver Rating", value=ratings_df.iloc[0]['Max_Driver_Rating'])
-            with col2:
-                st.metric(label="Minimum Driver Rating", value=ratings_df.iloc[0]['Min_Driver_Rating'])
-            st.markdown("### Comparison of Ratings")
-            plot_df = ratings_df.T.reset_index()
-            plot_df.columns = ['Rating_Type', 'Rating_Value']
-            fig = px.bar(
-                plot_df,
-                x='Rating_Type',
-                y='Rating_Value',
-                color='Rating_Type',
-                title='Max vs. Min Driver Ratings for Prime Sedan',
-                labels={'Rating_Value': 'Rating', 'Rating_Type': ''}
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.info("No Prime Sedan booking data available to calculate ratings.")
-
-    elif insight_selection == "Incomplete Ride Reasons":
-        st.header("📊 Distribution of Incomplete Ride Reasons")
-
-        incomplete_rides_query = """
-        SELECT
-            Booking_ID,
-            Incomplete_Rides_Reason
-        FROM
-            ola_rides_tbl
-        WHERE
-            Is_Incomplete = TRUE
-        LIMIT 100; -- Limiting to 100 rows for display efficiency in Streamlit
-        """
-        incomplete_rides_df = run_query(incomplete_rides_query)
-
-        if not incomplete_rides_df.empty:
-            st.dataframe(incomplete_rides_df, use_container_width=True)
-            st.info("Displayed the first 100 incomplete rides for performance.")
-        else:
-            st.info("No incomplete rides found.")
-
-
-        incomplete_reasons_query = """
-        SELECT
-            Incomplete_Rides_Reason,
-            COUNT(*) AS Total_Count
-        FROM
-            ola_rides_tbl
-        WHERE
-            Is_Incomplete = TRUE
-        GROUP BY
-            Incomplete_Rides_Reason
-        ORDER BY
-            Total_Count DESC;
-        """
-        incomplete_reasons_df = run_query(incomplete_reasons_query)
-        if not incomplete_reasons_df.empty:
-            fig = px.pie(
-                incomplete_reasons_df,
-                values='Total_Count',
-                names='Incomplete_Rides_Reason',
-                title='Distribution of Incomplete Ride Reasons',
-                hole=0.3
-            )
-            fig.update_traces(textposition='inside', textinfo='percent+label')
-            st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.info("No incomplete rides found to generate the pie chart.")
-
-    elif insight_selection == "Total Cancellations":
-        st.header("Total Cancellations & Incomplete Rides")
-        col1, col2 = st.columns(2)
-        with col1:
-            customer_cancelled_rides_query = """
-            SELECT COUNT(*) AS Total_Customer_Cancelled_Rides
-            FROM ola_rides_tbl
-            WHERE booking_status = 'Canceled by Customer';
-            """
-            customer_cancelled_rides_df = run_query(customer_cancelled_rides_query)
-            if not customer_cancelled_rides_df.empty:
-                total_cancelled = customer_cancelled_rides_df.iloc[0, 0]
-                st.metric(label="Total Rides Cancelled by Customers", value=total_cancelled)
-            else:
-                st.info("No data available for customer cancelled rides.")
-        with col2:
-            incomplete_rides_query = """
-            SELECT
-                COUNT(*) AS Total_Incomplete_Rides
-            FROM
-                ola_rides_tbl
-            WHERE
-                Is_Incomplete = TRUE;
-            """
-            incomplete_rides_df = run_query(incomplete_rides_query)
-            if not incomplete_rides_df.empty:
-                total_incomplete = incomplete_rides_df.iloc[0, 0]
-                st.metric(label="Total Incomplete Rides", value=total_incomplete)
-            else:
-                st.info("No incomplete rides found.")
-
-    elif insight_selection == "Successful Bookings":
-        st.header("All Successful Ola Bookings")
-        successful_bookings_query = """
-        SELECT
-            Booking_ID,
-            Customer_ID,
-            Vehicle_Type,
-            Pickup_Location,
-            Drop_Location,
-            Booking_Value,
-            Payment_Method,
-            Ride_Distance,
-            Timestamp
-        FROM
-            ola_rides_tbl
-        WHERE
-            Booking_Status = 'Success'
-        LIMIT 100; -- Limiting to 100 rows for display efficiency in Streamlit
-        """
-        successful_bookings_df = run_query(successful_bookings_query)
-
-        if not successful_bookings_df.empty:
-            st.dataframe(successful_bookings_df, use_container_width=True)
-            st.info("Displayed the first 100 successful bookings for performance.")
-        else:
-            st.info("No successful bookings found.")
-        st.markdown("---")
+    insight_selection = st.sidebar.radio("Jump to Section:", list(INSIGHT_SECTIONS.keys()))
 
+    # Only the selected section's fragment runs, so the other sections'
+    # queries and rendering are skipped entirely on each rerun.
+    INSIGHT_SECTIONS[insight_selection]()